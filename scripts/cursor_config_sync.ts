@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { execSync } from 'child_process';
+import { pathToFileURL } from 'url';
 import { z } from 'zod';
 
 // Cursor Configuration Schema
@@ -418,7 +419,7 @@ export class CursorConfigSynchronizer {
 }
 
 // CLI interface
-if (require.main === module) {
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
   const command = process.argv[2];
   const configDir = process.argv[3] || './cursor-config';
   
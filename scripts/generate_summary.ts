@@ -1,5 +1,6 @@
 import fs from 'fs';
 import path from 'path';
+import { pathToFileURL } from 'url';
 
 interface SummaryData {
   timestamp: string;
@@ -347,31 +348,38 @@ function formatSummary(data: SummaryData): string {
   return lines.join('\n');
 }
 
-// Main execution
-if (require.main === module) {
+// Generate the summary and write it to LATEST_SUMMARY.md (also called in
+// process by scripts/npm_daemon.js, so it must not exit)
+function writeSummary(): SummaryData {
+  console.log('Generating project summary...');
+  
+  const summaryData = generateSummary();
+  const formattedSummary = formatSummary(summaryData);
+  
+  // Write to LATEST_SUMMARY.md
+  fs.writeFileSync('LATEST_SUMMARY.md', formattedSummary);
+  
+  console.log('✅ Summary generated successfully!');
+  console.log('📄 Written to: LATEST_SUMMARY.md');
+  console.log('');
+  console.log('📊 Summary Statistics:');
+  console.log(`   - Scripts: ${summaryData.scripts.total}`);
+  console.log(`   - Tools: ${summaryData.tools.integrated.length} integrated`);
+  console.log(`   - Tests: ${summaryData.tests.total} files`);
+  console.log(`   - Schemas: ${summaryData.schemas.total} files`);
+  console.log(`   - Machine Sync Features: ${summaryData.machineSync.features.length}`);
+  
+  return summaryData;
+}
+
+// Main execution (ES module: compare against the entry script, not require.main)
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
   try {
-    console.log('Generating project summary...');
-    
-    const summaryData = generateSummary();
-    const formattedSummary = formatSummary(summaryData);
-    
-    // Write to LATEST_SUMMARY.md
-    fs.writeFileSync('LATEST_SUMMARY.md', formattedSummary);
-    
-    console.log('✅ Summary generated successfully!');
-    console.log('📄 Written to: LATEST_SUMMARY.md');
-    console.log('');
-    console.log('📊 Summary Statistics:');
-    console.log(`   - Scripts: ${summaryData.scripts.total}`);
-    console.log(`   - Tools: ${summaryData.tools.integrated.length} integrated`);
-    console.log(`   - Tests: ${summaryData.tests.total} files`);
-    console.log(`   - Schemas: ${summaryData.schemas.total} files`);
-    console.log(`   - Machine Sync Features: ${summaryData.machineSync.features.length}`);
-    
+    writeSummary();
   } catch (error) {
     console.error('❌ Error generating summary:', error);
     process.exit(1);
   }
 }
 
-export { generateSummary, formatSummary }; 
\ No newline at end of file
+export { generateSummary, formatSummary, writeSummary }; 
\ No newline at end of file
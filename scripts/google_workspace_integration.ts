@@ -2,6 +2,7 @@ import { google } from 'googleapis';
 import { z } from 'zod';
 import fs from 'fs';
 import path from 'path';
+import { pathToFileURL } from 'url';
 
 // 🔒 MANDATORY: Barton Doctrine enforcement
 import { START_WITH_BARTON_DOCTRINE } from '../src/core/mandatory-barton-doctrine';
@@ -553,7 +554,7 @@ export class GoogleWorkspaceIntegration {
 }
 
 // CLI interface
-if (require.main === module) {
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
   const command = process.argv[2];
   const configPath = process.argv[3] || 'google-workspace-config.json';
 
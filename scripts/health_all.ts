@@ -0,0 +1,113 @@
+import fs from 'fs';
+import path from 'path';
+import { pathToFileURL } from 'url';
+
+type HealthResult = { status: 'healthy' | 'unhealthy'; error?: string };
+
+// Credentials file written by setup_env.py
+const ENV_FILE = '.env';
+
+/**
+ * Load KEY=VALUE lines from .env into process.env
+ *
+ * The GUIs don't start from a shell with the API keys exported, so they are
+ * read here. Variables already set win, as with dotenv; comments, `export`
+ * and quoted values are understood.
+ */
+function loadEnvFile(file: string = ENV_FILE): void {
+  if (!fs.existsSync(file)) {
+    return;
+  }
+  for (const line of fs.readFileSync(file, 'utf8').split(/\r?\n/)) {
+    const match = line.match(/^\s*(?:export\s+)?([A-Za-z_][\w.]*)\s*=\s*(.*?)\s*$/);
+    if (!match) {
+      continue;
+    }
+    const [, name, raw] = match;
+    const quoted = raw.match(/^(['"])(.*)\1$/);
+    if (process.env[name] === undefined) {
+      process.env[name] = quoted ? quoted[2] : raw.replace(/\s+#.*$/, '');
+    }
+  }
+}
+
+/** Read required environment variables, naming every one that is missing */
+function requireEnv(...names: string[]): string[] {
+  const missing = names.filter(name => !process.env[name]);
+  if (missing.length) {
+    throw new Error(`${missing.join(', ')} not set (add to ${ENV_FILE})`);
+  }
+  return names.map(name => process.env[name] as string);
+}
+
+/**
+ * One health check per integration, keyed by the id used in the JSON result map.
+ * Each integration module is imported lazily, so a missing dependency only
+ * fails its own check.
+ */
+const CHECKS: Record<string, () => Promise<{ status: string }>> = {
+  google: async () => {
+    const { GoogleWorkspaceIntegration } = await import('./google_workspace_integration');
+    const config = JSON.parse(fs.readFileSync('google-workspace-config.json', 'utf8'));
+    return new GoogleWorkspaceIntegration(config).healthCheck();
+  },
+  mindpal: async () => {
+    const [apiKey] = requireEnv('MINDPAL_API_KEY');
+    const { MindPalIntegration, MindPalConfigSchema } = await import('./mindpal_integration');
+    return new MindPalIntegration(MindPalConfigSchema.parse({ apiKey })).healthCheck();
+  },
+  deerflow: async () => {
+    const [apiKey] = requireEnv('DEERFLOW_API_KEY');
+    const { DeerFlowIntegration, DeerFlowConfigSchema } = await import('./deerflow_integration');
+    return new DeerFlowIntegration(DeerFlowConfigSchema.parse({ apiKey })).healthCheck();
+  },
+  render: async () => {
+    const [apiKey, webhookUrl] = requireEnv('RENDER_API_KEY', 'RENDER_WEBHOOK_URL');
+    const { RenderIntegration, RenderConfigSchema } = await import('./render_integration');
+    return new RenderIntegration(RenderConfigSchema.parse({ apiKey, webhookUrl })).healthCheck();
+  },
+  make: async () => {
+    const [apiKey] = requireEnv('MAKE_API_KEY');
+    const { MakeIntegration, MakeConfigSchema } = await import('./make_integration');
+    return new MakeIntegration(MakeConfigSchema.parse({ apiKey })).healthCheck();
+  },
+};
+
+/**
+ * Run every integration health check concurrently
+ *
+ * Credentials come from the environment, filled in from .env first. A check
+ * whose variables are missing fails with their names.
+ * Logs one line per integration, then prints the result map as a single JSON
+ * line (the last line of output) for callers such as sync_gui.py to parse.
+ */
+async function healthAll(): Promise<Record<string, HealthResult>> {
+  loadEnvFile();
+  const entries = await Promise.all(Object.entries(CHECKS).map(async ([name, check]): Promise<[string, HealthResult]> => {
+    try {
+      const { status } = await check();
+      return [name, { status: status === 'healthy' ? 'healthy' : 'unhealthy' }];
+    } catch (error) {
+      return [name, { status: 'unhealthy', error: error instanceof Error ? error.message : String(error) }];
+    }
+  }));
+  const results = Object.fromEntries(entries);
+
+  for (const [name, result] of entries) {
+    console.log(`${result.status === 'healthy' ? '✅' : '❌'} ${name}${result.error ? `: ${result.error}` : ''}`);
+  }
+  console.log(JSON.stringify(results));
+  return results;
+}
+
+// CLI interface
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
+  healthAll()
+    .then(results => process.exit(Object.values(results).every(r => r.status === 'healthy') ? 0 : 1))
+    .catch(error => {
+      console.error('❌ Health checks failed:', error);
+      process.exit(1);
+    });
+}
+
+export { healthAll };
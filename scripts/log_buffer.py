@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Buffered GUI Log
+Timestamped log lines shared by simple_gui.py and sync_gui.py: lines are
+queued and inserted into the log widget in batches on the Tk thread
+"""
+
+import collections
+import time
+import tkinter as tk
+
+# Milliseconds between batched log widget updates (~20 Hz)
+LOG_FLUSH_MS = 50
+
+# The log keeps the newest LOG_MAX_LINES lines, trimmed in LOG_TRIM_LINES steps
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+
+class BufferedLog:
+    """Mixin for a window with self.root and a self.log_text Text widget
+
+    log() only appends to a deque (appends are thread-safe), so any thread
+    may call it; flush_log() inserts the queued lines on the Tk thread.
+    Call init_log() before the first log() and poll_log() once from the Tk
+    thread to flush every LOG_FLUSH_MS (or call flush_log() from a poll of
+    your own).
+    """
+
+    def init_log(self):
+        self.log_buffer = collections.deque()
+        # (second, formatted "%H:%M:%S") of the last log timestamp
+        self.log_timestamp = (None, "")
+
+    def log(self, message):
+        """Queue a timestamped message from any thread; flush_log inserts it"""
+        # Output arrives in bursts, so format the timestamp once per second
+        now = int(time.time())
+        second, timestamp = self.log_timestamp
+        if now != second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self.log_timestamp = (now, timestamp)
+        self.log_buffer.append(f"[{timestamp}] {message}\n")
+
+    def log_output(self, line, stream="stdout"):
+        """Log one line of command output, skipping blank lines"""
+        line = line.rstrip()
+        if line:
+            self.log(line)
+
+    def poll_log(self):
+        """Tk-thread poll: flush the log, then run again after LOG_FLUSH_MS"""
+        self.root.after(LOG_FLUSH_MS, self.poll_log)
+        self.flush_log()
+
+    def flush_log(self):
+        """Insert all queued log lines with a single Text insert"""
+        lines = []
+        while self.log_buffer:
+            lines.append(self.log_buffer.popleft())
+        if not lines:
+            return
+        # A read-only log is enabled only around the insert
+        read_only = str(self.log_text.cget('state')) == 'disabled'
+        if read_only:
+            self.log_text.configure(state='normal')
+        self.log_text.insert(tk.END, "".join(lines))
+        # Drop the oldest lines in one delete once past the high-water mark
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES + LOG_TRIM_LINES:
+            self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
+        if read_only:
+            self.log_text.configure(state='disabled')
+        self.log_text.see(tk.END)
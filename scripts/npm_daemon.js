@@ -0,0 +1,289 @@
+#!/usr/bin/env node
+
+/**
+ * npm Script Daemon
+ *
+ * Long-lived helper used by the Python tools (quick_test.py, simple_gui.py,
+ * sync_gui.py)
+ * to run package.json scripts without paying npm's CLI startup on every
+ * invocation. It does what `npm run` does for a script: runs the pre/post
+ * hooks, puts node_modules/.bin on PATH and sets the npm_* lifecycle env.
+ *
+ * It can also import a project module and call one of its exports in
+ * process (e.g. the summary generator), skipping the per-run node and tsx
+ * startup entirely; TypeScript modules load through tsx's ESM loader. Only
+ * the entry module is re-imported when it changes on disk; modules it
+ * imports stay cached for the daemon's life, and a module call cannot be
+ * killed. Use it for self-contained entry points and run anything else as a
+ * script.
+ *
+ * Protocol (one JSON object per line):
+ *   stdin:  {"id": 1, "cmd": ["run", "build"]}   run a script (also ["test"])
+ *           {"id": 1, "module": "scripts/x.ts", "export": "main", "args": []}
+ *                                                 call a module export in process
+ *           {"id": 1, "kill": true}               kill a running script request
+ *   stdout: {"ready": true}                       first line, once requests are accepted
+ *           {"id": 1, "stream": "stdout", "line": "..."}
+ *           {"id": 1, "rc": 0}                    request finished
+ *
+ * Requests run concurrently; closing stdin kills anything still running.
+ */
+
+import fs from 'fs';
+import path from 'path';
+import readline from 'readline';
+import { format } from 'util';
+import { pathToFileURL } from 'url';
+import { AsyncLocalStorage } from 'async_hooks';
+import { spawn, spawnSync } from 'child_process';
+
+// Shorthand npm commands that map straight onto a script
+const SCRIPT_ALIASES = ['test', 'start', 'stop', 'restart'];
+
+const running = new Map();
+let manifest = null;
+let typeScriptLoader = false;
+
+// Console output from in-process module calls goes to the request that made
+// it; anything else goes to stderr so it cannot corrupt the protocol stream
+const moduleRequest = new AsyncLocalStorage();
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+for (const [method, stream] of [['log', 'stdout'], ['info', 'stdout'], ['warn', 'stderr'], ['error', 'stderr']]) {
+  console[method] = (...args) => {
+    const id = moduleRequest.getStore();
+    if (id === undefined) {
+      process.stderr.write(format(...args) + '\n');
+      return;
+    }
+    for (const line of format(...args).split(/\r?\n/)) {
+      send({ id, stream, line });
+    }
+  };
+}
+
+function findProjectRoot(dir) {
+  while (!fs.existsSync(path.join(dir, 'package.json'))) {
+    const parent = path.dirname(dir);
+    if (parent === dir) {
+      return null;
+    }
+    dir = parent;
+  }
+  return dir;
+}
+
+/** Load package.json, re-reading it only when it changed on disk */
+function loadManifest(root) {
+  const file = path.join(root, 'package.json');
+  const mtime = fs.statSync(file).mtimeMs;
+  if (!manifest || manifest.file !== file || manifest.mtime !== mtime) {
+    manifest = { file, mtime, pkg: JSON.parse(fs.readFileSync(file, 'utf8')) };
+  }
+  return manifest.pkg;
+}
+
+function quoteArg(arg) {
+  if (/^[\w@%+=:,./-]+$/.test(arg)) {
+    return arg;
+  }
+  return process.platform === 'win32'
+    ? `"${arg.replace(/"/g, '""')}"`
+    : `'${arg.replace(/'/g, `'\\''`)}'`;
+}
+
+function pipeLines(id, stream, name) {
+  let partial = '';
+  stream.setEncoding('utf8');
+  stream.on('data', chunk => {
+    const lines = (partial + chunk).split(/\r?\n/);
+    partial = lines.pop();
+    for (const line of lines) {
+      send({ id, stream: name, line });
+    }
+  });
+  stream.on('end', () => {
+    if (partial) {
+      send({ id, stream: name, line: partial });
+    }
+  });
+}
+
+function runScript(id, root, pkg, name, args) {
+  const env = {
+    ...process.env,
+    PATH: path.join(root, 'node_modules', '.bin') + path.delimiter + (process.env.PATH || ''),
+    npm_lifecycle_event: name,
+    npm_lifecycle_script: pkg.scripts[name],
+    npm_package_name: pkg.name || '',
+    npm_package_version: pkg.version || ''
+  };
+  const command = [pkg.scripts[name], ...args.map(quoteArg)].join(' ');
+
+  return new Promise(resolve => {
+    send({ id, stream: 'stdout', line: `> ${pkg.name}@${pkg.version} ${name}` });
+    send({ id, stream: 'stdout', line: `> ${command}` });
+    const child = spawn(command, {
+      cwd: root,
+      env,
+      shell: true,
+      // Own process group on POSIX so a kill reaches the whole script tree
+      detached: process.platform !== 'win32',
+      stdio: ['ignore', 'pipe', 'pipe'],
+      windowsHide: true
+    });
+    running.get(id).child = child;
+    pipeLines(id, child.stdout, 'stdout');
+    pipeLines(id, child.stderr, 'stderr');
+    child.on('error', error => {
+      send({ id, stream: 'stderr', line: error.message });
+    });
+    child.on('close', (code, signal) => resolve(signal ? 1 : code));
+  });
+}
+
+async function handleRun(id, cmd) {
+  running.set(id, { child: null, killed: false });
+  try {
+    const root = findProjectRoot(process.cwd());
+    if (!root) {
+      send({ id, stream: 'stderr', line: 'npm error Could not find package.json' });
+      return 1;
+    }
+    const pkg = loadManifest(root);
+    const scripts = pkg.scripts || {};
+    const [verb, ...rest] = cmd;
+    const name = SCRIPT_ALIASES.includes(verb) ? verb : rest.shift();
+    if ((verb !== 'run' && verb !== 'run-script' && !SCRIPT_ALIASES.includes(verb)) || !name) {
+      send({ id, stream: 'stderr', line: `npm_daemon: unsupported command: npm ${cmd.join(' ')}` });
+      return 1;
+    }
+    if (!scripts[name]) {
+      send({ id, stream: 'stderr', line: `npm error Missing script: "${name}"` });
+      return 1;
+    }
+
+    // Same order as npm: pre<name>, <name> (with args), post<name>
+    const steps = [[`pre${name}`, []], [name, rest], [`post${name}`, []]];
+    for (const [step, args] of steps) {
+      if (!scripts[step]) {
+        continue;
+      }
+      const code = await runScript(id, root, pkg, step, args);
+      if (code !== 0 || running.get(id).killed) {
+        return code || 1;
+      }
+    }
+    return 0;
+  } catch (error) {
+    send({ id, stream: 'stderr', line: `npm_daemon: ${error.message}` });
+    return 1;
+  } finally {
+    running.delete(id);
+  }
+}
+
+/** Import a project module (the entry itself is re-imported when it changed on disk) and call one export */
+async function handleModule(id, request) {
+  const root = findProjectRoot(process.cwd());
+  if (!root) {
+    send({ id, stream: 'stderr', line: 'npm_daemon: Could not find package.json' });
+    return 1;
+  }
+  const file = path.resolve(root, request.module);
+  if (/\.[cm]?tsx?$/.test(file) && !typeScriptLoader) {
+    // module.register only exists from Node 18.19 / 20.6, so it is looked up
+    // here; a static import would stop the daemon from starting on older Node
+    const { register } = await import('module');
+    if (typeof register !== 'function') {
+      send({ id, stream: 'stderr', line: `npm_daemon: TypeScript modules need Node 18.19+ or 20.6+ (running ${process.version})` });
+      return 1;
+    }
+    try {
+      // Resolved from the project's node_modules, like `npx tsx`
+      register('tsx/esm', pathToFileURL(path.join(root, 'package.json')));
+      typeScriptLoader = true;
+    } catch (error) {
+      send({ id, stream: 'stderr', line: `npm_daemon: cannot load TypeScript (is tsx installed?): ${error.message}` });
+      return 1;
+    }
+  }
+  try {
+    // Module scripts use paths relative to the project root
+    process.chdir(root);
+    return await moduleRequest.run(id, async () => {
+      const url = `${pathToFileURL(file).href}?mtime=${fs.statSync(file).mtimeMs}`;
+      const exports = await import(url);
+      const name = request.export || 'default';
+      if (typeof exports[name] !== 'function') {
+        send({ id, stream: 'stderr', line: `npm_daemon: ${request.module} has no exported function ${name}` });
+        return 1;
+      }
+      await exports[name](...(request.args || []));
+      return 0;
+    });
+  } catch (error) {
+    for (const line of String(error && error.stack || error).split(/\r?\n/)) {
+      send({ id, stream: 'stderr', line });
+    }
+    return 1;
+  }
+}
+
+function killRequest(id) {
+  const request = running.get(id);
+  if (!request) {
+    return;
+  }
+  request.killed = true;
+  const child = request.child;
+  if (!child || child.exitCode !== null) {
+    return;
+  }
+  try {
+    if (process.platform === 'win32') {
+      spawnSync('taskkill', ['/pid', String(child.pid), '/T', '/F'], { windowsHide: true });
+    } else {
+      process.kill(-child.pid, 'SIGKILL');
+    }
+  } catch {
+    // Already gone
+  }
+}
+
+const input = readline.createInterface({ input: process.stdin });
+
+input.on('line', async line => {
+  if (!line.trim()) {
+    return;
+  }
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    send({ id: null, stream: 'stderr', line: `npm_daemon: bad request: ${error.message}` });
+    return;
+  }
+  if (request.kill) {
+    killRequest(request.id);
+    return;
+  }
+  const rc = request.module
+    ? await handleModule(request.id, request)
+    : await handleRun(request.id, request.cmd || []);
+  send({ id: request.id, rc });
+});
+
+input.on('close', () => {
+  for (const id of running.keys()) {
+    killRequest(id);
+  }
+  process.exit(0);
+});
+
+// Handshake: a daemon that fails before this line (e.g. an unsupported Node)
+// is treated as unavailable by the clients
+send({ ready: true });
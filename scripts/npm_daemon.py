@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+npm Daemon Client
+Runs package.json scripts through the long-lived scripts/npm_daemon.js helper,
+so npm's CLI startup is paid once per session instead of once per command
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import signal
+import subprocess
+import threading
+
+DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "npm_daemon.js")
+
+# Resolve node once; on Windows keep the daemon from opening a console window
+NODE = shutil.which("node") or "node"
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+# Resolve npm (npm.cmd on Windows) once so commands run without a shell
+NPM = shutil.which("npm") or "npm"
+
+# Seconds to wait for the daemon's {"ready": true} line before giving up on it
+START_TIMEOUT = 10
+
+def kill_process_tree(proc):
+    """Kill a directly spawned npm process and the scripts it started
+
+    npm runs scripts in grandchildren, so on POSIX, where the process was
+    started with start_new_session, kill its whole session, not just npm.
+    """
+    try:
+        if os.name != 'nt':
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+def is_ready(line):
+    """True if line is the daemon's startup handshake"""
+    try:
+        return json.loads(line) == {"ready": True}
+    except ValueError:
+        return False
+
+class NpmDaemon:
+    """Client for npm_daemon.js; run() is safe to call from several threads"""
+
+    def __init__(self, env=None, cwd=None):
+        self.proc = subprocess.Popen(
+            [NODE, DAEMON_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            env=env,
+            cwd=cwd,
+            creationflags=CREATION_FLAGS
+        )
+        # A daemon that exits during startup would fail every request with
+        # a broken pipe; report it as unavailable instead. A daemon that hangs
+        # is killed, which ends the readline.
+        timer = threading.Timer(START_TIMEOUT, self.proc.kill)
+        timer.start()
+        try:
+            ready = is_ready(self.proc.stdout.readline())
+        finally:
+            timer.cancel()
+        if not ready:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc.stdin.close()
+            self.proc.stdout.close()
+            raise OSError("npm daemon failed to start")
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.requests = {}
+        self.reader = threading.Thread(target=self.read_replies, daemon=True)
+        self.reader.start()
+
+    def read_replies(self):
+        """Dispatch daemon output lines to the request that produced them"""
+        for line in self.proc.stdout:
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            request = self.requests.get(reply.get("id"))
+            if request is None:
+                continue
+            if "rc" in reply:
+                request["rc"] = reply["rc"]
+                request["done"].set()
+            elif request["on_line"] is not None:
+                request["on_line"](reply.get("line", ""), reply.get("stream", "stdout"))
+
+        # Daemon exited: fail whatever is still waiting
+        for request in list(self.requests.values()):
+            request["done"].set()
+
+    def send(self, message):
+        with self.lock:
+            self.proc.stdin.write(json.dumps(message) + "\n")
+            self.proc.stdin.flush()
+
+    def start(self, args, on_line=None):
+        """Start `npm <args>` in the daemon and return a request id for wait()
+
+        on_line(line, stream) is called from the reader thread for every
+        output line.
+        """
+        with self.lock:
+            self.next_id += 1
+            request_id = self.next_id
+        self.requests[request_id] = {"args": list(args), "on_line": on_line,
+                                     "done": threading.Event(), "rc": None}
+        try:
+            self.send({"id": request_id, "cmd": list(args)})
+        except OSError:
+            del self.requests[request_id]
+            raise
+        return request_id
+
+    def wait(self, request_id, timeout=None):
+        """Wait for a started request and return its exit code
+
+        Raises subprocess.TimeoutExpired after killing the script if it
+        does not finish within timeout seconds.
+        """
+        request = self.requests[request_id]
+        try:
+            if not request["done"].wait(timeout):
+                self.send({"id": request_id, "kill": True})
+                request["done"].wait(5)
+                raise subprocess.TimeoutExpired(["npm", *request["args"]], timeout)
+        finally:
+            del self.requests[request_id]
+
+        if request["rc"] is None:
+            raise RuntimeError("npm daemon exited unexpectedly")
+        return request["rc"]
+
+    def run(self, args, on_line=None, timeout=None):
+        """Run `npm <args>` in the daemon and return its exit code"""
+        return self.wait(self.start(args, on_line), timeout)
+
+    def close(self):
+        """Stop the daemon; scripts still running are killed"""
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+        # The reader stops at EOF; only then is stdout safe to close
+        self.reader.join()
+        self.proc.stdout.close()
+
+class AsyncNpmDaemon:
+    """asyncio client for npm_daemon.js; output callbacks run on the event loop"""
+
+    def __init__(self, proc):
+        self.proc = proc
+        self.next_id = 0
+        self.requests = {}
+        self.reader = asyncio.ensure_future(self.read_replies())
+
+    @classmethod
+    async def create(cls, env=None, cwd=None):
+        proc = await asyncio.create_subprocess_exec(
+            NODE, DAEMON_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+            cwd=cwd,
+            creationflags=CREATION_FLAGS,
+            limit=1 << 20
+        )
+        # A daemon that exits during startup would fail every request with
+        # a broken pipe; report it as unavailable instead
+        try:
+            ready = is_ready(await asyncio.wait_for(proc.stdout.readline(), START_TIMEOUT))
+        except asyncio.TimeoutError:
+            ready = False
+        if not ready:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            raise OSError("npm daemon failed to start")
+        return cls(proc)
+
+    async def read_replies(self):
+        """Dispatch daemon output lines to the request that produced them"""
+        try:
+            while True:
+                line = await self.proc.stdout.readline()
+                if not line:
+                    break
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                request = self.requests.get(reply.get("id"))
+                if request is None:
+                    continue
+                future, on_line = request
+                if "rc" in reply:
+                    if not future.done():
+                        future.set_result(reply["rc"])
+                elif on_line is not None:
+                    on_line(reply.get("line", ""), reply.get("stream", "stdout"))
+        finally:
+            # Daemon exited: fail whatever is still waiting
+            for future, _ in self.requests.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("npm daemon exited unexpectedly"))
+
+    def send(self, message):
+        self.proc.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+
+    async def run(self, args, on_line=None, timeout=None):
+        """Run `npm <args>` in the daemon and return its exit code
+
+        on_line(line, stream) is called for every output line. The script is
+        killed if the call times out (subprocess.TimeoutExpired) or is
+        cancelled.
+        """
+        return await self.request({"cmd": list(args)}, ["npm", *args], on_line, timeout, killable=True)
+
+    async def run_module(self, module, export="default", args=(), on_line=None, timeout=None):
+        """Call export(*args) of a project module inside the daemon; 0 on success
+
+        module is relative to the project root (TypeScript loads through tsx)
+        and is imported again only when it changed on disk; the modules it
+        imports are not, so use run() for anything that is not self-contained.
+        Its console output goes to on_line. The daemon cannot interrupt a
+        module call, so on timeout or cancellation this still waits for the
+        call to finish (or the daemon to exit) before raising.
+        """
+        message = {"module": module, "export": export, "args": list(args)}
+        return await self.request(message, ["node", module], on_line, timeout, killable=False)
+
+    async def request(self, message, command, on_line, timeout, killable):
+        """Send one request and wait for its exit code; command is for errors"""
+        self.next_id += 1
+        request_id = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.requests[request_id] = (future, on_line)
+        try:
+            self.send({"id": request_id, **message})
+            await self.proc.stdin.drain()
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                await self.stop(request_id, future, killable)
+                raise subprocess.TimeoutExpired(command, timeout) from None
+            except asyncio.CancelledError:
+                await self.stop(request_id, future, killable)
+                raise
+        finally:
+            del self.requests[request_id]
+
+    async def stop(self, request_id, future, killable):
+        """Kill a request that is given up on, or wait out one that can't be killed
+
+        Waiting means a caller holding a lock keeps it until the work really
+        ended, so nothing can start a second copy alongside it. Cancellation
+        during the wait is deferred until the request is done.
+        """
+        cancelled = False
+        if killable:
+            self.send({"id": request_id, "kill": True})
+            await asyncio.wait({future}, timeout=5)
+        else:
+            while not future.done():
+                try:
+                    await asyncio.wait({future})
+                except asyncio.CancelledError:
+                    cancelled = True
+        # The caller raises its own error; mark a daemon-exit error as seen
+        if future.done():
+            future.exception()
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def close(self):
+        """Stop the daemon; scripts still running are killed"""
+        try:
+            self.proc.stdin.close()
+            await asyncio.wait_for(self.proc.wait(), 5)
+        except (OSError, asyncio.TimeoutError):
+            self.proc.kill()
+            await self.proc.wait()
+        await self.reader
+
+async def start_async_daemon(env=None, cwd=None):
+    """Start an AsyncNpmDaemon, or return None when node or the daemon is unavailable"""
+    try:
+        return await AsyncNpmDaemon.create(env=env, cwd=cwd)
+    except OSError:
+        return None
+
+def start_daemon(env=None, cwd=None):
+    """Start an NpmDaemon, or return None when node or the daemon is unavailable"""
+    try:
+        return NpmDaemon(env=env, cwd=cwd)
+    except OSError:
+        return None
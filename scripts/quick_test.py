@@ -6,65 +6,149 @@ Tests basic functionality to see what's working
 
 import subprocess
 import os
+import io
 import sys
+import tempfile
+import time
+from npm_daemon import NPM, kill_process_tree, start_daemon
 
-def run_test(command, description):
-    """Run a test command and return result"""
-    print(f"🧪 Testing: {description}")
-    try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            encoding='utf-8', 
-            errors='replace', 
-            timeout=30
-        )
-        
-        if result.returncode == 0:
-            print(f"✅ {description} - PASSED")
-            return True
-        else:
-            print(f"❌ {description} - FAILED")
-            if result.stderr:
-                print(f"   Error: {result.stderr.strip()}")
-            return False
-    except Exception as e:
-        print(f"❌ {description} - ERROR: {str(e)}")
-        return False
+# npm checks the registry for a newer npm on every `npm run`; that lookup is
+# pure overhead for a local smoke test, so switch it off for the children.
+NPM_ENV = dict(os.environ, npm_config_update_notifier="false")
+
+# Seconds the whole suite may take; tests still running at the deadline
+# are killed, so one hung command can't stretch the run
+SUITE_TIMEOUT = 60
+
+class TestRun:
+    """A test command started right away and collected later by finish()"""
+
+    def __init__(self, command, description, daemon=None):
+        self.command = command
+        self.description = description
+        self.daemon = daemon
+        self.error = None
+        self.stderr_lines = []
+        try:
+            if daemon is not None:
+                self.request_id = daemon.start(command[1:], on_line=self.collect)
+            else:
+                # stdout is never reported and stderr goes to a temp file, so
+                # no child can stall on a full pipe while a sibling is awaited
+                self.stderr_file = tempfile.TemporaryFile()
+                self.proc = subprocess.Popen(
+                    command, 
+                    stdout=subprocess.DEVNULL, 
+                    stderr=self.stderr_file, 
+                    env=NPM_ENV,
+                    start_new_session=(os.name != 'nt')
+                )
+        except Exception as e:
+            self.error = e
+
+    def collect(self, line, stream):
+        if stream == "stderr":
+            self.stderr_lines.append(line)
+
+    def wait(self, timeout):
+        """Wait for the command and return (returncode, stderr)"""
+        if self.daemon is not None:
+            returncode = self.daemon.wait(self.request_id, timeout=timeout)
+            return returncode, "\n".join(self.stderr_lines)
+
+        try:
+            returncode = self.proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            kill_process_tree(self.proc)
+            self.proc.wait()
+            raise
+        finally:
+            self.stderr_file.seek(0)
+            stderr = self.stderr_file.read().decode('utf-8', errors='replace')
+            self.stderr_file.close()
+        return returncode, stderr
+
+    def finish(self, deadline):
+        """Wait until deadline at most and return (passed, report lines)"""
+        description = self.description
+        report = [f"🧪 Testing: {description}"]
+        try:
+            if self.error is not None:
+                raise self.error
+            try:
+                returncode, stderr = self.wait(max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"still running at the {SUITE_TIMEOUT} s suite deadline") from None
+            
+            if returncode == 0:
+                report.append(f"✅ {description} - PASSED")
+                return True, report
+            else:
+                report.append(f"❌ {description} - FAILED")
+                if stderr:
+                    report.append(f"   Error: {stderr.strip()}")
+                return False, report
+        except Exception as e:
+            report.append(f"❌ {description} - ERROR: {str(e)}")
+            return False, report
 
 def main():
     """Main test function"""
-    print("🔧 WeeWee Definition Update System - Quick Test")
-    print("=" * 50)
+    # Collect the report and write it with a single flush at the end instead
+    # of a console write per line
+    out = io.StringIO()
+    try:
+        report_tests(out)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+def report_tests(out):
+    """Run every test and write the report to out"""
+    deadline = time.monotonic() + SUITE_TIMEOUT
+    print("🔧 WeeWee Definition Update System - Quick Test", file=out)
+    print("=" * 50, file=out)
     
     tests = [
-        ("npm run sync-cursor export", "Cursor Config Export"),
-        ("npm run generate-summary", "Generate Summary"),
-        ("npm run build", "TypeScript Build"),
-        ("npm run lint", "Code Linting"),
+        ([NPM, "run", "sync-cursor", "export"], "Cursor Config Export"),
+        ([NPM, "run", "generate-summary"], "Generate Summary"),
+        ([NPM, "run", "build"], "TypeScript Build"),
+        ([NPM, "run", "lint"], "Code Linting"),
     ]
     
     passed = 0
     total = len(tests)
     
-    for command, description in tests:
-        if run_test(command, description):
-            passed += 1
-        print()
+    # The npm scripts are independent, so start them all at once and then
+    # wait on each in turn from this one thread; the slowest test bounds the
+    # total. Reports are printed in declaration order so the output stays
+    # readable. One npm daemon serves every test so npm's startup is paid
+    # once, not per test.
+    daemon = start_daemon(env=NPM_ENV)
+    try:
+        runs = [TestRun(command, description, daemon) for command, description in tests]
+        for run in runs:
+            ok, report = run.finish(deadline)
+            print("\n".join(report), file=out)
+            if ok:
+                passed += 1
+            print(file=out)
+    finally:
+        if daemon is not None:
+            daemon.close()
     
-    print("=" * 50)
-    print(f"📊 Results: {passed}/{total} tests passed")
+    print("=" * 50, file=out)
+    print(f"📊 Results: {passed}/{total} tests passed", file=out)
     
     if passed == total:
-        print("🎉 All tests passed! The system is working correctly.")
+        print("🎉 All tests passed! The system is working correctly.", file=out)
     else:
-        print("⚠️  Some tests failed. Check the errors above.")
-        print("\n💡 Common issues:")
-        print("   - Missing environment variables (check .env file)")
-        print("   - Missing API keys for external services")
-        print("   - Network connectivity issues")
-        print("   - Missing dependencies")
+        print("⚠️  Some tests failed. Check the errors above.", file=out)
+        print("\n💡 Common issues:", file=out)
+        print("   - Missing environment variables (check .env file)", file=out)
+        print("   - Missing API keys for external services", file=out)
+        print("   - Network connectivity issues", file=out)
+        print("   - Missing dependencies", file=out)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
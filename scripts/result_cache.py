@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+GUI Result Cache
+Stat-only fingerprints of command inputs, shared by simple_gui.py and
+sync_gui.py, so a command whose inputs are unchanged since its last
+successful run can be skipped
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+# Fingerprints of the last successful runs, keyed by npm arguments
+# (e.g. "run generate-summary"), relative to the project directory
+RESULT_CACHE_FILE = os.path.join(".cache", "gui-results.json")
+
+# Directories never descended into while fingerprinting
+CACHE_SKIP_DIRS = {"node_modules", ".git", ".cache", "__pycache__"}
+
+# Everything generateSummary() reads (package.json, DOCTRINE.md, .husky,
+# scripts/, src/__tests__, src/schemas, schemas/), plus its own output so a
+# deleted LATEST_SUMMARY.md is regenerated
+SUMMARY_INPUTS = ("package.json", "DOCTRINE.md", ".husky", "scripts", "src", "schemas", "LATEST_SUMMARY.md")
+
+def fingerprint(paths, root="."):
+    """Hash path, mtime and size of every file under paths (no file reads)
+
+    paths are relative to root and hashed that way, so both GUIs get the
+    same fingerprint for the same tree.
+    """
+    digest = hashlib.sha1()
+    for name in paths:
+        top = os.path.join(root, name)
+        for dirpath, dirnames, filenames in os.walk(top) if os.path.isdir(top) else [(root, [], [name])]:
+            dirnames[:] = sorted(d for d in dirnames if d not in CACHE_SKIP_DIRS)
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{os.path.relpath(path, root)}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def load_result_cache(root="."):
+    """Load cached fingerprints, ignoring a missing or corrupt file"""
+    try:
+        with open(os.path.join(root, RESULT_CACHE_FILE), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_result_cache(cache, root="."):
+    """Atomically persist cached fingerprints (temp file + rename); raises OSError"""
+    cache_file = os.path.join(root, RESULT_CACHE_FILE)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, cache_file)
@@ -6,11 +6,9 @@ Creates a .env file with placeholder values for testing
 
 import os
 import sys
+import mmap
 
-def create_env_file():
-    """Create a .env file with placeholder values"""
-    
-    env_content = """# WeeWee Definition Update System Environment Variables
+ENV_TEMPLATE = """# WeeWee Definition Update System Environment Variables
 # Replace these placeholder values with your actual credentials
 
 # Firebase Configuration
@@ -38,6 +36,7 @@ NEON_SSL=true
 
 # Render Configuration
 RENDER_API_KEY=your-render-api-key
+RENDER_WEBHOOK_URL=your-render-webhook-url
 RENDER_SERVICE_ID=your-render-service-id
 
 # MindPal Configuration
@@ -67,10 +66,15 @@ SYNC_ENCRYPTION_KEY=your-encryption-key
 NODE_ENV=development
 LOG_LEVEL=info
 """
-    
+
+# Encoded once at import; .env is written as raw bytes
+ENV_BYTES = ENV_TEMPLATE.encode('utf-8')
+
+def create_env_file():
+    """Create a .env file with placeholder values"""
     try:
-        with open('.env', 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        with open('.env', 'wb') as f:
+            f.write(ENV_BYTES)
         print("✅ Created .env file with placeholder values")
         print("📝 Please edit .env file with your actual credentials")
         return True
@@ -80,16 +84,29 @@ LOG_LEVEL=info
 
 def check_env_file():
     """Check if .env file exists and has required variables"""
-    if not os.path.exists('.env'):
+    try:
+        # One open instead of exists() + open()
+        fd = os.open('.env', os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except FileNotFoundError:
         print("❌ .env file not found")
         return False
+    except Exception as e:
+        print(f"❌ Error reading .env file: {e}")
+        return False
     
     try:
-        with open('.env', 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Search the mapped file in place instead of copying it into Python;
+        # mapping an empty file raises ValueError, and it has no placeholders
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                has_placeholder = mm.find(b'your-') != -1
+        except ValueError:
+            has_placeholder = False
+        finally:
+            os.close(fd)
         
         # Check for placeholder values
-        if 'your-' in content:
+        if has_placeholder:
             print("⚠️  .env file contains placeholder values")
             print("📝 Please update with actual credentials")
             return False
@@ -8,19 +8,87 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import subprocess
 import threading
+import queue
 import os
 import sys
-from datetime import datetime
+import collections
+from npm_daemon import NPM, kill_process_tree, start_daemon
+from log_buffer import LOG_FLUSH_MS, BufferedLog
+from result_cache import SUMMARY_INPUTS, fingerprint, load_result_cache, save_result_cache
 
-class SimpleCursorGUI:
+# Initial window size; the window opens centered on screen
+WINDOW_WIDTH = 500
+WINDOW_HEIGHT = 400
+
+# Seconds before a running command is killed
+COMMAND_TIMEOUT = 60
+
+# Results of slow npm commands are cached against a stat-only fingerprint of
+# their inputs (see result_cache), so re-clicking with an unchanged tree skips
+# the subprocess. Keyed by the npm arguments, e.g. "run generate-summary".
+# Every file the command reads must be covered, or an edit serves a stale
+# result: the tests import the integrations under scripts/, and node_modules
+# is not walked, so dependency changes show up through package-lock.json.
+CACHED_COMMANDS = {
+    "run generate-summary": SUMMARY_INPUTS,
+    "test": ("package.json", "package-lock.json", "tsconfig.json", ".env", "src", "scripts"),
+}
+
+class SimpleCursorGUI(BufferedLog):
+    # (name, button label, command, description, status text, success message, failure message)
+    ACTIONS = [
+        ("export", "📤 Export Cursor Config", [NPM, "run", "sync-cursor", "export"],
+         "Export Cursor configuration", "Exporting Cursor configuration...",
+         "Cursor configuration exported successfully!",
+         "Failed to export Cursor configuration. Check the log for details."),
+        ("import", "📥 Import Cursor Config", [NPM, "run", "sync-cursor", "import"],
+         "Import Cursor configuration", "Importing Cursor configuration...",
+         "Cursor configuration imported successfully!",
+         "Failed to import Cursor configuration. Check the log for details."),
+        ("summary", "📊 Generate Summary", [NPM, "run", "generate-summary"],
+         "Generate project summary", "Generating project summary...",
+         "Project summary generated successfully!",
+         "Failed to generate project summary. Check the log for details."),
+        ("test", "🧪 Run Tests", [NPM, "test"],
+         "Run project tests", "Running tests...",
+         "Tests completed successfully!",
+         "Some tests failed. Check the log for details."),
+    ]
+    
     def __init__(self, root):
         self.root = root
         self.root.title("WeeWee Definition Update System - Simple GUI")
-        self.root.geometry("500x400")
+        # Center from the known window size before any widgets exist; screen
+        # dimensions don't need a layout pass, unlike winfo_width/height
+        screen_width, screen_height = root.winfo_screenwidth(), root.winfo_screenheight()
+        x = (screen_width - WINDOW_WIDTH) // 2
+        y = (screen_height - WINDOW_HEIGHT) // 2
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
         self.root.resizable(True, True)
         
+        # Other threads never call Tk: they append log lines (see
+        # BufferedLog) and UI calls to deques (appends are thread-safe),
+        # which poll_ui drains on the Tk thread every LOG_FLUSH_MS
+        self.init_log()
+        self.ui_calls = collections.deque()
+        
         self.setup_ui()
-        self.sync_in_progress = False
+        self.root.after(LOG_FLUSH_MS, self.poll_ui)
+        self.result_cache = load_result_cache()
+        
+        # npm scripts run through one long-lived npm daemon when node is
+        # available; run_command falls back to spawning npm directly. The
+        # worker starts it on first use (see get_npm_daemon), so the window
+        # does not wait for node.
+        self.npm_daemon = None
+        self.npm_daemon_tried = False
+        
+        # One long-lived worker runs queued commands in order, so clicks
+        # queue up behind a running operation instead of being rejected.
+        self.pending_jobs = 0
+        self.jobs = queue.Queue()
+        self.worker = threading.Thread(target=self.run_jobs, daemon=True)
+        self.worker.start()
         
     def setup_ui(self):
         # Main frame
@@ -47,22 +115,14 @@ class SimpleCursorGUI:
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.grid(row=2, column=0, pady=(0, 20))
         
-        # Core buttons
-        self.export_btn = ttk.Button(buttons_frame, text="📤 Export Cursor Config", 
-                                    command=self.export_cursor, width=25)
-        self.export_btn.grid(row=0, column=0, padx=(0, 10), pady=(0, 10))
-        
-        self.import_btn = ttk.Button(buttons_frame, text="📥 Import Cursor Config", 
-                                    command=self.import_cursor, width=25)
-        self.import_btn.grid(row=0, column=1, padx=(0, 10), pady=(0, 10))
-        
-        self.summary_btn = ttk.Button(buttons_frame, text="📊 Generate Summary", 
-                                     command=self.generate_summary, width=25)
-        self.summary_btn.grid(row=1, column=0, padx=(0, 10), pady=(0, 10))
-        
-        self.test_btn = ttk.Button(buttons_frame, text="🧪 Run Tests", 
-                                  command=self.run_tests, width=25)
-        self.test_btn.grid(row=1, column=1, padx=(0, 10), pady=(0, 10))
+        # Core buttons, two per row, in ACTIONS order
+        self.buttons = {}
+        for index, action in enumerate(self.ACTIONS):
+            name, label = action[0], action[1]
+            button = ttk.Button(buttons_frame, text=label, width=25,
+                                command=lambda action=action: self.dispatch(action))
+            button.grid(row=index // 2, column=index % 2, padx=(0, 10), pady=(0, 10))
+            self.buttons[name] = button
         
         # Progress bar
         self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
@@ -86,42 +146,50 @@ class SimpleCursorGUI:
         self.log("Simple WeeWee Definition Update System GUI started")
         self.log(f"Current directory: {os.getcwd()}")
         
-    def log(self, message):
-        """Add message to log with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_message)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    def call_in_ui(self, func, *args):
+        """Run func(*args) on the Tk thread at the next poll; safe from any thread"""
+        self.ui_calls.append((func, args))
+        
+    def poll_ui(self):
+        """Tk-thread poll: flush the log, then run calls queued by other threads"""
+        # Rescheduled first, so the log keeps flowing while a call's dialog is open
+        self.root.after(LOG_FLUSH_MS, self.poll_ui)
+        self.flush_log()
+        while self.ui_calls:
+            func, args = self.ui_calls.popleft()
+            func(*args)
+            
+    def get_npm_daemon(self):
+        """Return the npm daemon, or None without one; worker thread only
+
+        Started on first use and restarted if it has exited. A daemon that
+        fails to start is not retried; commands then spawn npm directly.
+        """
+        daemon = self.npm_daemon
+        if daemon is not None and daemon.proc.poll() is not None:
+            self.log("npm daemon exited, restarting it")
+            daemon = None
+        elif daemon is not None or self.npm_daemon_tried:
+            return daemon
+        self.npm_daemon_tried = True
+        self.npm_daemon = daemon = start_daemon()
+        return daemon
         
     def run_command(self, command, description):
-        """Run a command and log the output"""
+        """Run a command and stream its output to the log line by line"""
         self.log(f"Running: {description}")
         try:
-            # Use UTF-8 encoding and handle encoding errors gracefully
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                encoding='utf-8', 
-                errors='replace', 
-                timeout=60
-            )
-            
-            if result.stdout:
-                output = result.stdout.strip()
-                if output:
-                    self.log(f"Output: {output}")
-            if result.stderr:
-                error = result.stderr.strip()
-                if error:
-                    self.log(f"Error: {error}")
+            daemon = self.get_npm_daemon() if command[0] == NPM else None
+            if daemon is not None:
+                returncode = daemon.run(command[1:], on_line=self.log_output, timeout=COMMAND_TIMEOUT)
+            else:
+                returncode = self.run_process(command)
                 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log(f"✅ {description} completed successfully")
                 return True
             else:
-                self.log(f"❌ {description} failed with code {result.returncode}")
+                self.log(f"❌ {description} failed with code {returncode}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -131,117 +199,109 @@ class SimpleCursorGUI:
             self.log(f"💥 {description} failed: {str(e)}")
             return False
             
-    def export_cursor(self):
-        """Export Cursor configuration"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Operation in Progress", "Please wait for current operation to complete.")
-            return
-            
-        self.sync_in_progress = True
-        self.export_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Exporting Cursor configuration...")
-        
-        def export_thread():
-            try:
-                success = self.run_command("npm run sync-cursor export", "Export Cursor configuration")
-                
-                if success:
-                    messagebox.showinfo("Success", "Cursor configuration exported successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to export Cursor configuration. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.export_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready")
-                
-        threading.Thread(target=export_thread, daemon=True).start()
+    def run_process(self, command):
+        """Run a command directly, streaming output; returns its exit code"""
+        # Use UTF-8 encoding and handle encoding errors gracefully
+        proc = subprocess.Popen(
+            command, 
+            stdout=subprocess.PIPE, 
+            stderr=subprocess.STDOUT, 
+            bufsize=1, 
+            encoding='utf-8', 
+            errors='replace', 
+            start_new_session=(os.name != 'nt')
+        )
         
-    def import_cursor(self):
-        """Import Cursor configuration"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Operation in Progress", "Please wait for current operation to complete.")
-            return
+        # npm runs scripts in grandchildren that inherit the pipe, so on
+        # POSIX kill the whole session or the read loop never sees EOF
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            kill_process_tree(proc)
+        watchdog = threading.Timer(COMMAND_TIMEOUT, kill)
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                self.log_output(line)
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
             
-        self.sync_in_progress = True
-        self.import_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Importing Cursor configuration...")
-        
-        def import_thread():
-            try:
-                success = self.run_command("npm run sync-cursor import", "Import Cursor configuration")
-                
-                if success:
-                    messagebox.showinfo("Success", "Cursor configuration imported successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to import Cursor configuration. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.import_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready")
-                
-        threading.Thread(target=import_thread, daemon=True).start()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, COMMAND_TIMEOUT)
+        return returncode
+            
+    def save_result_cache(self):
+        """Atomically persist cached fingerprints (temp file + rename)"""
+        try:
+            save_result_cache({cmd: fp for cmd, fp in self.result_cache.items() if cmd in CACHED_COMMANDS})
+        except OSError as e:
+            self.log(f"Could not save result cache: {e}")
+            
+    def run_cached_command(self, command, description):
+        """Run a command unless its inputs are unchanged since the last success
+
+        Returns (success, cached); cached is True when the command was skipped.
+        """
+        key = " ".join(command[1:])
+        inputs = CACHED_COMMANDS[key]
+        if self.result_cache.get(key) == fingerprint(inputs):
+            self.log(f"✅ {description} up to date (no input changes, cached result)")
+            return True, True
+            
+        success = self.run_command(command, description)
+        if success:
+            # Fingerprint again so files written by the command itself count
+            self.result_cache[key] = fingerprint(inputs)
+            self.save_result_cache()
+        return success, False
         
-    def generate_summary(self):
-        """Generate project summary"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Operation in Progress", "Please wait for current operation to complete.")
-            return
+    def run_uncached_command(self, command, description):
+        """run_command with run_cached_command's (success, cached) result"""
+        return self.run_command(command, description), False
             
-        self.sync_in_progress = True
-        self.summary_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Generating project summary...")
+    def run_jobs(self):
+        """Worker loop: run queued commands one at a time"""
+        while True:
+            button, status, run, command, description, on_done = self.jobs.get()
+            self.call_in_ui(lambda text=status: self.status_label.config(text=text))
+            result = run(command, description)
+            self.call_in_ui(self.finish_job, button, on_done, result)
+            
+    def submit(self, button, status, run, command, description, on_done):
+        """Queue a command for the worker thread and disable its button"""
+        button.config(state='disabled')
+        self.pending_jobs += 1
+        if self.pending_jobs == 1:
+            self.progress.start()
+            self.status_label.config(text=status)
+        self.jobs.put((button, status, run, command, description, on_done))
         
-        def summary_thread():
-            try:
-                success = self.run_command("npm run generate-summary", "Generate project summary")
-                
-                if success:
-                    messagebox.showinfo("Success", "Project summary generated successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to generate project summary. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.summary_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready")
-                
-        threading.Thread(target=summary_thread, daemon=True).start()
+    def finish_job(self, button, on_done, result):
+        """Tk-thread completion handler for a queued command"""
+        self.pending_jobs -= 1
+        button.config(state='normal')
+        if self.pending_jobs == 0:
+            self.progress.stop()
+            self.status_label.config(text="Ready")
+        on_done(*result)
         
-    def run_tests(self):
-        """Run project tests"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Operation in Progress", "Please wait for current operation to complete.")
-            return
-            
-        self.sync_in_progress = True
-        self.test_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Running tests...")
+    def dispatch(self, action):
+        """Queue one of ACTIONS on the worker and report its result when done"""
+        name, label, command, description, status, ok_msg, err_msg = action
+        run = self.run_cached_command if " ".join(command[1:]) in CACHED_COMMANDS else self.run_uncached_command
         
-        def test_thread():
-            try:
-                success = self.run_command("npm test", "Run project tests")
-                
-                if success:
-                    messagebox.showinfo("Success", "Tests completed successfully!")
-                else:
-                    messagebox.showerror("Error", "Some tests failed. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.test_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready")
+        def done(success, cached):
+            if cached:
+                messagebox.showwarning("Cached Result", f"{ok_msg}\n\nNot run again: no inputs changed since the "
+                                       "last successful run, so this is the cached result.")
+            elif success:
+                messagebox.showinfo("Success", ok_msg)
+            else:
+                messagebox.showerror("Error", err_msg)
                 
-        threading.Thread(target=test_thread, daemon=True).start()
+        self.submit(self.buttons[name], status, run, command, description, done)
 
 def main():
     """Main function to start the GUI"""
@@ -249,14 +309,12 @@ def main():
         root = tk.Tk()
         app = SimpleCursorGUI(root)
         
-        # Center the window
-        root.update_idletasks()
-        x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-        y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-        root.geometry(f"+{x}+{y}")
-        
         # Start the GUI
-        root.mainloop()
+        try:
+            root.mainloop()
+        finally:
+            if app.npm_daemon is not None:
+                app.npm_daemon.close()
         
     except Exception as e:
         print(f"Failed to start GUI: {e}")
@@ -0,0 +1,85 @@
+import fs from 'fs';
+import path from 'path';
+import { pathToFileURL } from 'url';
+import { CursorConfigSynchronizer } from './cursor_config_sync';
+import { MachineSynchronizer } from './sync_all_machines';
+import { ToolSyncManager } from './tool_sync_manager';
+
+const CURSOR_CONFIG_DIR = 'cursor-config';
+const MACHINE_CONFIG_FILE = 'machine-sync-config.json';
+const TOOL_CONFIG_FILE = 'tool-sync-config.json';
+
+interface SyncAllResult {
+  success: boolean;
+  steps: Record<string, { success: boolean; errors: string[] }>;
+}
+
+/**
+ * Run the Cursor, machine and tool syncs in one node process
+ *
+ * Same steps as the GUI's "Sync Everything": import Cursor config when
+ * cursor-config/ exists (export otherwise), then sync machines and tools when
+ * their config files exist. Every step runs even if an earlier one failed.
+ * Throws when any step failed, so in-process callers see a failure.
+ */
+async function syncAll(projectDir: string = '.'): Promise<SyncAllResult> {
+  const steps: SyncAllResult['steps'] = {};
+  // One directory read answers every "does it exist" question below
+  const entries = new Set(fs.readdirSync(projectDir));
+  const cursorDir = path.join(projectDir, CURSOR_CONFIG_DIR);
+
+  const cursor = new CursorConfigSynchronizer();
+  if (entries.has(CURSOR_CONFIG_DIR)) {
+    console.log('📥 Importing Cursor configuration...');
+    const result = await cursor.importConfig(cursorDir);
+    steps['cursor-import'] = { success: result.success, errors: result.errors };
+  } else {
+    console.log('📤 Exporting Cursor configuration...');
+    const result = await cursor.exportConfig(cursorDir);
+    steps['cursor-export'] = { success: result.success, errors: result.errors };
+  }
+
+  if (entries.has(MACHINE_CONFIG_FILE)) {
+    console.log('🖥️ Syncing machine configuration...');
+    const config = JSON.parse(fs.readFileSync(path.join(projectDir, MACHINE_CONFIG_FILE), 'utf8'));
+    const result = await new MachineSynchronizer(config).syncAllMachines();
+    console.log(result.summary);
+    steps.machines = {
+      success: result.success,
+      errors: Object.values(result.results).flatMap(r => r.errors),
+    };
+  }
+
+  if (entries.has(TOOL_CONFIG_FILE)) {
+    console.log('🔧 Syncing tool configuration...');
+    const config = JSON.parse(fs.readFileSync(path.join(projectDir, TOOL_CONFIG_FILE), 'utf8'));
+    const result = await new ToolSyncManager(config).syncAllTools();
+    console.log(result.summary);
+    steps.tools = {
+      success: result.success,
+      errors: Object.values(result.results).flatMap(tools => Object.values(tools).flatMap(r => r.errors)),
+    };
+  }
+
+  for (const [name, step] of Object.entries(steps)) {
+    console.log(`${step.success ? '✅' : '❌'} ${name}${step.errors.length ? `: ${step.errors.join(', ')}` : ''}`);
+  }
+
+  const success = Object.values(steps).every(step => step.success);
+  if (!success) {
+    throw new Error(`Sync failed: ${Object.keys(steps).filter(name => !steps[name].success).join(', ')}`);
+  }
+  return { success, steps };
+}
+
+// CLI interface
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
+  syncAll(process.argv[2] || '.')
+    .then(() => process.exit(0))
+    .catch(error => {
+      console.error('❌', error instanceof Error ? error.message : error);
+      process.exit(1);
+    });
+}
+
+export { syncAll };
@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { execSync } from 'child_process';
+import { pathToFileURL } from 'url';
 import { z } from 'zod';
 
 // Machine Sync Configuration Schema
@@ -507,7 +508,7 @@ export class MachineSynchronizer {
 }
 
 // CLI interface
-if (require.main === module) {
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
   const configPath = process.argv[2] || 'machine-sync-config.json';
   
   if (!fs.existsSync(configPath)) {
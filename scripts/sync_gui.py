@@ -5,17 +5,88 @@ A simple GUI application to sync Cursor configuration and tools across machines.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import messagebox
 import subprocess
-import threading
+import asyncio
 import os
 import sys
 import json
-from datetime import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from npm_daemon import CREATION_FLAGS, NPM, kill_process_tree, start_async_daemon
+from log_buffer import BufferedLog
+from result_cache import SUMMARY_INPUTS, fingerprint, load_result_cache, save_result_cache
 
-class CursorSyncGUI:
-    def __init__(self, root):
+# Seconds before a running command is killed
+COMMAND_TIMEOUT = 300
+
+# Milliseconds between asyncio loop iterations driven from Tk
+LOOP_TICK_MS = 10
+
+# Worker threads for blocking calls made from actions (file system scans)
+WORKER_THREADS = 2
+
+# Sync actions skip generate-summary when its inputs are unchanged since the
+# last successful summary; the fingerprint is shared with simple_gui.py under
+# the same key (see result_cache)
+SUMMARY_CACHE_KEY = "run generate-summary"
+
+# Entry point called inside the npm daemon: (module, export, fallback command).
+# Only the entry module is re-imported when it changes, so this is for
+# self-contained modules; sync-all and health:all import other project
+# modules and run as scripts instead (fresh code, and killable on Abort).
+SUMMARY_ENTRY = ("scripts/generate_summary.ts", "writeSummary", [NPM, "run", "generate-summary"])
+
+def last_json_object(lines):
+    """Return the last of lines that parses as a JSON object, or {}"""
+    for line in reversed(lines):
+        try:
+            value = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            return value
+    return {}
+
+def guarded(button, status):
+    """Decorator for sync actions: one action at a time
+
+    While the action runs its button is disabled, the Abort button is enabled,
+    the progress bar spins and the status label shows status. A click during
+    another action is rejected by start_task before a task is created. The
+    action's result (see task_done) is passed through.
+    """
+    def decorate(action):
+        @functools.wraps(action)
+        async def run(self):
+            async with self.sync_lock:
+                getattr(self, button).config(state='disabled')
+                self.abort_btn.config(state='normal')
+                self.progress.start()
+                self.status_label.config(text=status)
+                try:
+                    return await action(self)
+                except asyncio.CancelledError:
+                    self.log("⛔ Aborted")
+                    raise
+                finally:
+                    getattr(self, button).config(state='normal')
+                    self.abort_btn.config(state='disabled')
+                    self.progress.stop()
+                    self.status_label.config(text="Ready to sync")
+        return run
+    return decorate
+
+class CursorSyncGUI(BufferedLog):
+    def __init__(self, root, loop):
         self.root = root
+        self.loop = loop
+        # Project directory, resolved once; every command and file check uses
+        # it explicitly rather than whatever the process cwd is at the time
+        self.cwd = os.getcwd()
+        # One bounded pool for blocking work, reused by every click
+        self.loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="sync"))
         self.root.title("WeeWee Definition Update System - Sync Tool")
         self.root.geometry("600x500")
         self.root.resizable(True, True)
@@ -26,10 +97,25 @@ class CursorSyncGUI:
         except:
             pass
         
+        # Log lines are buffered and flushed every LOG_FLUSH_MS (see BufferedLog)
+        self.init_log()
+        
+        # npm commands share one daemon for the app's lifetime (see npm_daemon)
+        self.npm_daemon_start = None
+        # Running action tasks, cancelled when the window closes
+        self.tasks = set()
+        
+        # Held by the running sync action (see guarded)
+        self.sync_lock = asyncio.Lock()
+        
         self.setup_ui()
-        self.sync_in_progress = False
+        self.root.after(0, self.poll_log)
         
     def setup_ui(self):
+        # Widget modules are only needed once the window is built, so a run
+        # that stops at main()'s package.json check skips importing them
+        from tkinter import ttk, scrolledtext
+        
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -56,17 +142,17 @@ class CursorSyncGUI:
         
         # Sync Cursor button
         self.sync_cursor_btn = ttk.Button(buttons_frame, text="🔄 Sync Cursor Config", 
-                                         command=self.sync_cursor, width=20)
+                                         command=lambda: self.start_task(self.sync_cursor), width=20)
         self.sync_cursor_btn.grid(row=0, column=0, padx=(0, 10))
         
         # Sync Everything button
         self.sync_all_btn = ttk.Button(buttons_frame, text="🚀 Sync Everything", 
-                                      command=self.sync_everything, width=20)
+                                      command=lambda: self.start_task(self.sync_everything), width=20)
         self.sync_all_btn.grid(row=0, column=1, padx=(0, 10))
         
         # Export button
         self.export_btn = ttk.Button(buttons_frame, text="📤 Export Config", 
-                                    command=self.export_config, width=20)
+                                    command=lambda: self.start_task(self.export_config), width=20)
         self.export_btn.grid(row=0, column=2)
         
         # Progress bar
@@ -79,7 +165,8 @@ class CursorSyncGUI:
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
+        # Read-only; flush_log enables it only around its insert
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70, state='disabled')
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Bottom buttons
@@ -88,48 +175,92 @@ class CursorSyncGUI:
         
         # Test button
         self.test_btn = ttk.Button(bottom_frame, text="🧪 Test Integrations", 
-                                  command=self.test_integrations, width=15)
+                                  command=lambda: self.start_task(self.test_integrations), width=15)
         self.test_btn.grid(row=0, column=0, padx=(0, 10))
         
         # Generate Summary button
         self.summary_btn = ttk.Button(bottom_frame, text="📊 Generate Summary", 
-                                     command=self.generate_summary, width=15)
+                                     command=lambda: self.start_task(self.generate_summary), width=15)
         self.summary_btn.grid(row=0, column=1, padx=(0, 10))
         
+        # Abort button (enabled while an action runs)
+        self.abort_btn = ttk.Button(bottom_frame, text="⛔ Abort", 
+                                   command=self.abort, width=15, state='disabled')
+        self.abort_btn.grid(row=0, column=2, padx=(0, 10))
+        
         # Exit button
         self.exit_btn = ttk.Button(bottom_frame, text="❌ Exit", 
                                   command=self.root.quit, width=15)
-        self.exit_btn.grid(row=0, column=2)
+        self.exit_btn.grid(row=0, column=3)
         
         # Initial log message
         self.log("WeeWee Definition Update System GUI started")
-        self.log(f"Current directory: {os.getcwd()}")
-        
-    def log(self, message):
-        """Add message to log with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_message)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
-        
-    def run_command(self, command, description):
-        """Run a command and log the output"""
+        self.log(f"Current directory: {self.cwd}")
+        
+    async def run_command(self, command, description, tag=None, on_line=None):
+        """Run a command and log the output
+
+        npm commands run through the shared npm daemon when node is available.
+        Output lines go to on_line (default: the log), prefixed with [tag]
+        when one is given.
+        """
         self.log(f"Running: {description}")
-        try:
-            result = subprocess.run(command, shell=True, capture_output=True, 
-                                  text=True, timeout=300)
+        on_line = on_line or self.log_output
+        if tag is not None:
+            on_line = lambda line, stream="stdout", emit=on_line: emit(line.strip() and f"[{tag}] {line}", stream)
+        
+        daemon = await self.npm_daemon() if command[0] == NPM else None
+        if daemon is not None:
+            run = daemon.run(command[1:], on_line=on_line, timeout=COMMAND_TIMEOUT)
+        else:
+            run = self.run_process(command, on_line)
+        return await self.report_result(description, run)
+        
+    async def run_process(self, command, on_line):
+        """Run a command directly, streaming output; returns its exit code"""
+        proc = await asyncio.create_subprocess_exec(
+            *command, 
+            stdout=asyncio.subprocess.PIPE, 
+            stderr=asyncio.subprocess.STDOUT, 
+            cwd=self.cwd, 
+            start_new_session=(os.name != 'nt'), 
+            creationflags=CREATION_FLAGS, 
+            limit=1 << 20
+        )
+        
+        async def pump():
+            async for line in proc.stdout:
+                on_line(line.decode('utf-8', errors='replace'))
+            return await proc.wait()
             
-            if result.stdout:
-                self.log(f"Output: {result.stdout.strip()}")
-            if result.stderr:
-                self.log(f"Error: {result.stderr.strip()}")
-                
-            if result.returncode == 0:
+        try:
+            return await asyncio.wait_for(pump(), COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(command, COMMAND_TIMEOUT) from None
+        finally:
+            if proc.returncode is None:
+                kill_process_tree(proc)
+                await proc.wait()
+        
+    async def run_concurrently(self, commands):
+        """Run (command, description) pairs at the same time
+
+        Output lines are tagged with their description; returns one success
+        flag per pair, in order.
+        """
+        return await asyncio.gather(*(
+            self.run_command(command, description, tag=description)
+            for command, description in commands))
+        
+    async def report_result(self, description, run):
+        """Log the outcome of awaiting run, which returns an exit code; True on success"""
+        try:
+            returncode = await run
+            if returncode == 0:
                 self.log(f"✅ {description} completed successfully")
                 return True
             else:
-                self.log(f"❌ {description} failed with code {result.returncode}")
+                self.log(f"❌ {description} failed with code {returncode}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -139,195 +270,269 @@ class CursorSyncGUI:
             self.log(f"💥 {description} failed: {str(e)}")
             return False
             
-    def sync_cursor(self):
-        """Sync Cursor configuration"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Sync in Progress", "Please wait for current sync to complete.")
-            return
-            
-        self.sync_in_progress = True
-        self.sync_cursor_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Syncing Cursor configuration...")
+    async def npm_daemon(self):
+        """Return the shared npm daemon (None without node)
+
+        Started on first use and restarted if it has exited, so npm's CLI
+        startup is paid once per session rather than once per command.
+        """
+        start = self.npm_daemon_start
+        if start is not None and start.done() and not start.cancelled():
+            daemon = start.result()
+            if daemon is not None and daemon.proc.returncode is not None:
+                start = None
+        if start is None:
+            # Concurrent callers await the same start instead of racing
+            start = self.npm_daemon_start = self.loop.create_task(start_async_daemon(cwd=self.cwd))
+        return await asyncio.shield(start)
         
-        def sync_thread():
-            try:
-                # Check if cursor-config exists
-                if os.path.exists("cursor-config"):
-                    success = self.run_command("npm run sync-cursor import", "Import Cursor configuration")
-                else:
-                    success = self.run_command("npm run sync-cursor export", "Export Cursor configuration")
+    async def close(self):
+        """Cancel running actions and stop the npm daemon
+
+        The daemon is stopped before waiting for the actions: a cancelled
+        in-process module call only ends when the daemon exits.
+        """
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        start = self.npm_daemon_start
+        if start is not None:
+            daemon = await start
+            if daemon is not None:
+                await daemon.close()
+        if tasks:
+            await asyncio.wait(tasks)
                 
-                if success:
-                    messagebox.showinfo("Success", "Cursor configuration synced successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to sync Cursor configuration. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.sync_cursor_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready to sync")
+    async def snapshot_files(self):
+        """Return the names in the project directory from one directory scan
+
+        Lets an action test for several files without a stat() per check,
+        and every check sees the same state of the directory. The scan runs
+        on the worker pool so a slow file system does not stall the window.
+        """
+        def scan():
+            with os.scandir(self.cwd) as entries:
+                return {entry.name for entry in entries}
                 
-        threading.Thread(target=sync_thread, daemon=True).start()
+        return await self.loop.run_in_executor(None, scan)
+            
+    async def run_entry(self, entry, description, on_line=None):
+        """Call a (module, export, fallback command) entry and log the result
+
+        The module stays loaded in the npm daemon, so there is no node/tsx
+        startup per call; without node the fallback npm command runs instead.
+        Output lines go to on_line (default: the log).
+        """
+        module, export, command = entry
+        daemon = await self.npm_daemon()
+        if daemon is None:
+            return await self.run_command(command, description, on_line=on_line)
+        self.log(f"Running: {description}")
+        return await self.report_result(description, daemon.run_module(
+            module, export, on_line=on_line or self.log_output, timeout=COMMAND_TIMEOUT))
+            
+    async def update_summary(self, force=False):
+        """Run generate-summary unless SUMMARY_INPUTS are unchanged since the last run
+
+        force regenerates regardless (the Generate Summary button).
+        """
+        description = "Generate project summary"
+        if not force:
+            current = await self.loop.run_in_executor(None, fingerprint, SUMMARY_INPUTS, self.cwd)
+            if current == load_result_cache(self.cwd).get(SUMMARY_CACHE_KEY):
+                self.log(f"✅ {description} up to date (no input changes, skipped)")
+                return True
+                
+        success = await self.run_entry(SUMMARY_ENTRY, description)
+        if success:
+            # Fingerprint after the run so files written by the command itself count
+            current = await self.loop.run_in_executor(None, fingerprint, SUMMARY_INPUTS, self.cwd)
+            cache = load_result_cache(self.cwd)
+            cache[SUMMARY_CACHE_KEY] = current
+            try:
+                save_result_cache(cache, self.cwd)
+            except OSError as e:
+                self.log(f"Could not save result cache: {e}")
+        return success
         
-    def sync_everything(self):
-        """Sync everything (Cursor + Tools + Machine config)"""
-        if self.sync_in_progress:
+    def abort(self):
+        """Abort button callback: cancel running actions
+
+        Cancellation kills the running command: a direct subprocess's process
+        group, or the script in the npm daemon. An in-process module call
+        (the summary) cannot be interrupted, so the action ends, and releases
+        the sync lock, only once the daemon reports it finished.
+        """
+        if self.tasks:
+            self.log("Aborting...")
+        for task in self.tasks:
+            task.cancel()
+            
+    def start_task(self, action):
+        """Button callback: schedule the action coroutine on the event loop
+
+        A click while another action runs only warns. The dialog is shown
+        here, in the Tk callback, not in a coroutine: a modal dialog inside
+        the event loop would stall the running action's output.
+        """
+        if self.tasks or self.sync_lock.locked():
             messagebox.showwarning("Sync in Progress", "Please wait for current sync to complete.")
             return
             
-        self.sync_in_progress = True
-        self.sync_all_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Syncing everything...")
-        
-        def sync_thread():
-            try:
-                success = True
-                
-                # Sync Cursor
-                if os.path.exists("cursor-config"):
-                    success &= self.run_command("npm run sync-cursor import", "Import Cursor configuration")
-                else:
-                    success &= self.run_command("npm run sync-cursor export", "Export Cursor configuration")
-                
-                # Sync machine configuration
-                if os.path.exists("machine-sync-config.json"):
-                    success &= self.run_command("npm run sync-machines", "Sync machine configuration")
-                
-                # Sync tool configuration
-                if os.path.exists("tool-sync-config.json"):
-                    success &= self.run_command("npm run sync-tools", "Sync tool configuration")
-                
-                # Generate summary
-                success &= self.run_command("npm run generate-summary", "Generate project summary")
-                
-                if success:
-                    messagebox.showinfo("Success", "Everything synced successfully!")
-                else:
-                    messagebox.showerror("Error", "Some sync operations failed. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.sync_all_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready to sync")
-                
-        threading.Thread(target=sync_thread, daemon=True).start()
+        task = self.loop.create_task(action())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        task.add_done_callback(self.task_done)
         
-    def export_config(self):
-        """Export current configuration"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Sync in Progress", "Please wait for current sync to complete.")
+    def task_done(self, task):
+        """Done callback: show the action's (dialog, title, message) result
+
+        The dialog opens from a Tk callback, after the action released the
+        sync lock and outside the event loop, so the loop keeps running
+        while it is open. An unexpected exception from the action is logged
+        and reported the same way instead of going unretrieved.
+        """
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.log(f"💥 Unexpected error: {type(error).__name__}: {error}")
+            self.root.after(0, messagebox.showerror, "Error",
+                            f"Unexpected error: {error}\n\nCheck the log for details.")
             return
+        result = task.result()
+        if result is not None:
+            dialog, title, message = result
+            self.root.after(0, dialog, title, message)
             
-        self.sync_in_progress = True
-        self.export_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Exporting configuration...")
+    @guarded("sync_cursor_btn", "Syncing Cursor configuration...")
+    async def sync_cursor(self):
+        """Sync Cursor configuration"""
+        # Check if cursor-config exists
+        if "cursor-config" in await self.snapshot_files():
+            success = await self.run_command([NPM, "run", "sync-cursor", "import"], "Import Cursor configuration")
+        else:
+            success = await self.run_command([NPM, "run", "sync-cursor", "export"], "Export Cursor configuration")
         
-        def export_thread():
-            try:
-                success = True
-                
-                # Export Cursor configuration
-                success &= self.run_command("npm run sync-cursor export", "Export Cursor configuration")
-                
-                # Generate machine sync config if it doesn't exist
-                if not os.path.exists("machine-sync-config.json"):
-                    success &= self.run_command("npm run sync-machines", "Generate machine sync configuration")
-                
-                # Generate tool sync config if it doesn't exist
-                if not os.path.exists("tool-sync-config.json"):
-                    success &= self.run_command("npm run sync-tools", "Generate tool sync configuration")
-                
-                # Generate summary
-                success &= self.run_command("npm run generate-summary", "Generate project summary")
-                
-                if success:
-                    messagebox.showinfo("Success", "Configuration exported successfully!")
-                else:
-                    messagebox.showerror("Error", "Some export operations failed. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.export_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready to sync")
-                
-        threading.Thread(target=export_thread, daemon=True).start()
+        if success:
+            return messagebox.showinfo, "Success", "Cursor configuration synced successfully!"
+        else:
+            return messagebox.showerror, "Error", "Failed to sync Cursor configuration. Check the log for details."
+        
+    @guarded("sync_all_btn", "Syncing everything...")
+    async def sync_everything(self):
+        """Sync everything (Cursor + Tools + Machine config)"""
+        # sync_all.ts picks the Cursor import/export and skips machines/tools
+        # without a config file; the summary comes last so it sees what the
+        # sync wrote, and runs even if the sync failed
+        results = [await self.run_command([NPM, "run", "sync-all"], "Sync Cursor, machine and tool configuration")]
+        results.append(await self.update_summary())
+        success = all(results)
+        
+        if success:
+            return messagebox.showinfo, "Success", "Everything synced successfully!"
+        else:
+            return messagebox.showerror, "Error", "Some sync operations failed. Check the log for details."
+        
+    @guarded("export_btn", "Exporting configuration...")
+    async def export_config(self):
+        """Export current configuration"""
+        files = await self.snapshot_files()
         
-    def test_integrations(self):
+        # Export Cursor configuration
+        steps = [([NPM, "run", "sync-cursor", "export"], "Export Cursor configuration")]
+        
+        # Generate machine sync config if it doesn't exist
+        if "machine-sync-config.json" not in files:
+            steps.append(([NPM, "run", "sync-machines"], "Generate machine sync configuration"))
+        
+        # Generate tool sync config if it doesn't exist
+        if "tool-sync-config.json" not in files:
+            steps.append(([NPM, "run", "sync-tools"], "Generate tool sync configuration"))
+        
+        # The exports write separate files, so run them side by side; the
+        # summary reads their output and runs after all of them
+        results = await self.run_concurrently(steps)
+        results.append(await self.update_summary())
+        success = all(results)
+        
+        if success:
+            return messagebox.showinfo, "Success", "Configuration exported successfully!"
+        else:
+            return messagebox.showerror, "Error", "Some export operations failed. Check the log for details."
+        
+    @guarded("test_btn", "Testing integrations...")
+    async def test_integrations(self):
         """Test all integrations"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Sync in Progress", "Please wait for current sync to complete.")
-            return
+        # (display name, id in health_all.ts's result map)
+        integrations = [
+            ("Google Workspace", "google"),
+            ("MindPal", "mindpal"),
+            ("DeerFlow", "deerflow"),
+            ("Render", "render"),
+            ("Make.com", "make"),
+        ]
+        
+        output = []
+        
+        def collect(line, stream="stdout"):
+            output.append(line)
+            self.log_output(line, stream)
             
-        self.sync_in_progress = True
-        self.test_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Testing integrations...")
+        # health_all.ts runs the probes side by side in one node process and
+        # ends its output with a JSON map of {id: {"status": ...}}
+        self.log(f"Testing {', '.join(name for name, _ in integrations)}...")
+        await self.run_command([NPM, "run", "health:all"], "Test integrations", on_line=collect)
+        results = last_json_object(output)
         
-        def test_thread():
-            try:
-                integrations = [
-                    ("Google Workspace", "npm run google:health"),
-                    ("MindPal", "npm run mindpal:health"),
-                    ("DeerFlow", "npm run deerflow:health"),
-                    ("Render", "npm run render:health"),
-                    ("Make.com", "npm run make:health"),
-                ]
-                
-                results = []
-                for name, command in integrations:
-                    self.log(f"Testing {name}...")
-                    success = self.run_command(command, f"Test {name}")
-                    results.append((name, success))
-                
-                # Show results
-                failed = [name for name, success in results if not success]
-                if failed:
-                    messagebox.showwarning("Test Results", 
-                                         f"Some integrations failed:\n{', '.join(failed)}\n\nCheck the log for details.")
-                else:
-                    messagebox.showinfo("Test Results", "All integrations working correctly!")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.test_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready to sync")
-                
-        threading.Thread(target=test_thread, daemon=True).start()
+        # Show results (an integration missing from the map failed)
+        failed = [name for name, key in integrations
+                  if not isinstance(results.get(key), dict) or results[key].get("status") != "healthy"]
+        if failed:
+            return (messagebox.showwarning, "Test Results",
+                    f"Some integrations failed:\n{', '.join(failed)}\n\nCheck the log for details.")
+        else:
+            return messagebox.showinfo, "Test Results", "All integrations working correctly!"
         
-    def generate_summary(self):
+    @guarded("summary_btn", "Generating summary...")
+    async def generate_summary(self):
         """Generate project summary"""
-        if self.sync_in_progress:
-            messagebox.showwarning("Sync in Progress", "Please wait for current sync to complete.")
-            return
-            
-        self.sync_in_progress = True
-        self.summary_btn.config(state='disabled')
-        self.progress.start()
-        self.status_label.config(text="Generating summary...")
+        success = await self.update_summary(force=True)
         
-        def summary_thread():
-            try:
-                success = self.run_command("npm run generate-summary", "Generate project summary")
-                
-                if success:
-                    messagebox.showinfo("Success", "Project summary generated successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to generate summary. Check the log for details.")
-                    
-            finally:
-                self.sync_in_progress = False
-                self.summary_btn.config(state='normal')
-                self.progress.stop()
-                self.status_label.config(text="Ready to sync")
-                
-        threading.Thread(target=summary_thread, daemon=True).start()
+        if success:
+            return messagebox.showinfo, "Success", "Project summary generated successfully!"
+        else:
+            return messagebox.showerror, "Error", "Failed to generate summary. Check the log for details."
+
+def run_event_loop(app):
+    """Drive the asyncio loop from Tk ("guest mode")
+
+    Every LOOP_TICK_MS the loop runs one non-blocking iteration, so coroutines
+    and subprocess I/O share the Tk thread. Dialogs open from Tk callbacks,
+    where the loop keeps ticking; should Tk ever be re-entered while the loop
+    is mid-iteration, that tick is skipped.
+    """
+    root, loop = app.root, app.loop
+    
+    def tick():
+        if not loop.is_running():
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+        root.after(LOOP_TICK_MS, tick)
+        
+    root.after(LOOP_TICK_MS, tick)
+    try:
+        root.mainloop()
+    finally:
+        # Cancel unfinished actions so their subprocesses are cleaned up
+        loop.run_until_complete(app.close())
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.wait(tasks))
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
 
 def main():
     """Main function"""
@@ -338,7 +543,9 @@ def main():
     
     # Create and run GUI
     root = tk.Tk()
-    app = CursorSyncGUI(root)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    app = CursorSyncGUI(root, loop)
     
     # Center the window
     root.update_idletasks()
@@ -346,7 +553,7 @@ def main():
     y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
     root.geometry(f"+{x}+{y}")
     
-    root.mainloop()
+    run_event_loop(app)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+npm Daemon Tests
+Runs npm_daemon.js against a temporary package.json through both clients
+
+Run from the project root: python -m unittest discover -s scripts -p "test_*.py"
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+import npm_daemon
+from npm_daemon import start_async_daemon, start_daemon
+
+# Scripts of the temporary project; "slow" records its shell's PID so a test
+# can check that a kill really ended it
+SCRIPTS = {
+    "prehello": "echo pre",
+    "hello": "echo out && echo err 1>&2",
+    "fail": "exit 3",
+    "slow": "echo $$ > slow.pid && sleep 30",
+}
+
+# Module called in process: finishes after a delay and leaves a marker file
+MODULE = """
+import fs from 'fs';
+export async function main(ms) {
+  console.log('started');
+  await new Promise(resolve => setTimeout(resolve, ms));
+  fs.writeFileSync('module.done', '');
+}
+"""
+
+def is_running(pid):
+    """True if pid is a live process (a zombie counts as ended)"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r', encoding='utf-8') as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+def wait_for_file(path, timeout=5):
+    """Wait until path exists and return its contents"""
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path) or not os.path.getsize(path):
+        if time.monotonic() > deadline:
+            raise AssertionError(f"{path} was not written")
+        time.sleep(0.05)
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class NpmDaemonTestCase(unittest.TestCase):
+    def setUp(self):
+        self.project = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.project, ignore_errors=True)
+        with open(os.path.join(self.project, "package.json"), 'w', encoding='utf-8') as f:
+            json.dump({"name": "daemon-test", "version": "1.0.0", "type": "module", "scripts": SCRIPTS}, f)
+        with open(os.path.join(self.project, "module.mjs"), 'w', encoding='utf-8') as f:
+            f.write(MODULE)
+
+    def path(self, name):
+        return os.path.join(self.project, name)
+
+    def assert_killed(self):
+        """The slow script was started and its process is gone"""
+        pid = int(wait_for_file(self.path("slow.pid")))
+        deadline = time.monotonic() + 5
+        while is_running(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(is_running(pid), "slow script still running")
+
+class NpmDaemonTest(NpmDaemonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.daemon = start_daemon(cwd=self.project)
+        self.assertIsNotNone(self.daemon)
+        self.addCleanup(self.daemon.close)
+
+    def test_run_streams_lines_and_returns_rc(self):
+        lines = []
+        self.assertEqual(self.daemon.run(["run", "hello"], on_line=lambda *line: lines.append(line)), 0)
+        self.assertIn(("pre", "stdout"), lines)
+        self.assertIn(("out", "stdout"), lines)
+        self.assertIn(("err", "stderr"), lines)
+        self.assertLess(lines.index(("pre", "stdout")), lines.index(("out", "stdout")))
+
+    def test_run_returns_script_failure(self):
+        self.assertEqual(self.daemon.run(["run", "fail"]), 3)
+
+    def test_missing_script_fails(self):
+        lines = []
+        self.assertEqual(self.daemon.run(["run", "nope"], on_line=lambda *line: lines.append(line)), 1)
+        self.assertIn(('npm error Missing script: "nope"', "stderr"), lines)
+
+    def test_concurrent_requests_are_routed_by_id(self):
+        slow = self.daemon.start(["run", "slow"])
+        self.assertEqual(self.daemon.run(["run", "fail"]), 3)
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.daemon.wait(slow, timeout=0.5)
+
+    def test_timeout_kills_script(self):
+        started = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.daemon.run(["run", "slow"], timeout=1)
+        self.assertLess(time.monotonic() - started, 10)
+        self.assert_killed()
+        # The daemon keeps serving requests
+        self.assertEqual(self.daemon.run(["run", "fail"]), 3)
+
+    def test_daemon_exit_fails_waiting_request(self):
+        request_id = self.daemon.start(["run", "slow"])
+        wait_for_file(self.path("slow.pid"))
+        self.daemon.proc.kill()
+        with self.assertRaisesRegex(RuntimeError, "exited unexpectedly"):
+            self.daemon.wait(request_id, timeout=5)
+
+class AsyncNpmDaemonTest(NpmDaemonTestCase):
+    def run_async(self, test):
+        async def run():
+            daemon = await start_async_daemon(cwd=self.project)
+            self.assertIsNotNone(daemon)
+            try:
+                await test(daemon)
+            finally:
+                await daemon.close()
+
+        asyncio.run(run())
+
+    def test_run_streams_lines_and_returns_rc(self):
+        async def test(daemon):
+            lines = []
+            self.assertEqual(await daemon.run(["run", "hello"], on_line=lambda *line: lines.append(line)), 0)
+            self.assertIn(("err", "stderr"), lines)
+            self.assertEqual(await daemon.run(["run", "fail"]), 3)
+
+        self.run_async(test)
+
+    def test_cancel_kills_script(self):
+        async def test(daemon):
+            task = asyncio.ensure_future(daemon.run(["run", "slow"]))
+            await asyncio.get_running_loop().run_in_executor(None, wait_for_file, self.path("slow.pid"))
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assert_killed()
+            self.assertEqual(await daemon.run(["run", "fail"]), 3)
+
+        self.run_async(test)
+
+    def test_run_module(self):
+        async def test(daemon):
+            lines = []
+            rc = await daemon.run_module("module.mjs", "main", [0], on_line=lambda *line: lines.append(line))
+            self.assertEqual(rc, 0)
+            self.assertIn(("started", "stdout"), lines)
+            self.assertEqual(await daemon.run_module("module.mjs", "nope"), 1)
+
+        self.run_async(test)
+
+    def test_cancelled_module_call_waits_until_finished(self):
+        async def test(daemon):
+            lines = []
+            task = asyncio.ensure_future(
+                daemon.run_module("module.mjs", "main", [1000], on_line=lambda *line: lines.append(line)))
+            while not lines:
+                await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The call cannot be killed, so cancellation only returns once it ended
+            self.assertTrue(os.path.exists(self.path("module.done")))
+
+        self.run_async(test)
+
+    def test_timed_out_module_call_waits_until_finished(self):
+        async def test(daemon):
+            with self.assertRaises(subprocess.TimeoutExpired):
+                await daemon.run_module("module.mjs", "main", [1000], timeout=0.2)
+            self.assertTrue(os.path.exists(self.path("module.done")))
+
+        self.run_async(test)
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class HandshakeTest(unittest.TestCase):
+    def setUp(self):
+        # A "daemon" that dies before sending {"ready": true}
+        fd, self.script = tempfile.mkstemp(suffix=".mjs")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write("process.exit(1);\n")
+        self.addCleanup(os.remove, self.script)
+        original = npm_daemon.DAEMON_SCRIPT
+        npm_daemon.DAEMON_SCRIPT = self.script
+        self.addCleanup(setattr, npm_daemon, "DAEMON_SCRIPT", original)
+
+    def test_daemon_that_exits_at_startup_is_unavailable(self):
+        self.assertIsNone(start_daemon())
+        self.assertIsNone(asyncio.run(start_async_daemon()))
+
+if __name__ == "__main__":
+    unittest.main()
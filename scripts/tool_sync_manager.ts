@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { execSync } from 'child_process';
+import { pathToFileURL } from 'url';
 import { z } from 'zod';
 
 // Tool Sync Configuration Schema
@@ -605,7 +606,7 @@ export class ToolSyncManager {
 }
 
 // CLI interface
-if (require.main === module) {
+if (process.argv[1] && import.meta.url === pathToFileURL(path.resolve(process.argv[1])).href) {
   const configPath = process.argv[2] || 'tool-sync-config.json';
   
   if (!fs.existsSync(configPath)) {